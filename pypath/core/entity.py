@@ -75,6 +75,7 @@ class Entity(session_mod.Logger, attrs_mod.AttributeHandler):
         'taxon',
         'label',
         'key',
+        '_hash',
     ]
 
 
@@ -122,6 +123,7 @@ class Entity(session_mod.Logger, attrs_mod.AttributeHandler):
 
         self._bootstrap(identifier, id_type, entity_type, taxon)
         self.key = self._key
+        self._hash = hash(self.key)
 
         attrs_mod.AttributeHandler.__init__(self, attrs)
 
@@ -429,7 +431,20 @@ class Entity(session_mod.Logger, attrs_mod.AttributeHandler):
 
     def __hash__(self):
 
-        return hash(self.key)
+        return self._hash
+
+
+    def __setstate__(self, state):
+
+        # the hash of strings is different in each interpreter session,
+        # hence the cached hash must be computed again after unpickling
+        for _state in (state if isinstance(state, tuple) else (state,)):
+
+            for attr, value in iteritems(_state or {}):
+
+                setattr(self, attr, value)
+
+        self._hash = hash(self.key)
 
 
     def __eq__(self, other):
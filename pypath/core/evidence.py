@@ -34,6 +34,7 @@ import copy
 
 import pypath.internals.refs as refs
 import pypath.share.common as common
+import pypath_common._constants as _const
 import pypath.share.session as session_mod
 import pypath.core.entity as entity
 import pypath.core.attrs as attrs_mod
@@ -390,6 +391,19 @@ class Evidence(attrs_mod.AttributeHandler):
         )
 
 
+    def match_any(self, resources = None, **kwargs):
+        """
+        Tells if the evidence matches any of the resources, with the other
+        criteria the same as in ``match``. If no resources provided, only the
+        other criteria are checked.
+        """
+
+        return any(
+            self.match(resource = resource, **kwargs)
+            for resource in resources or (None,)
+        )
+
+
     def __str__(self):
 
         return self.resource.name
@@ -473,7 +487,7 @@ class Evidences(object):
                     not isinstance(other, Evidence)
                 ) else
             (other,)
-                if isinstance(other, self.__class__) else
+                if isinstance(other, Evidence) else
             ()
         )
 
@@ -514,6 +528,52 @@ class Evidences(object):
         return self.__add__(other)
 
 
+    @classmethod
+    def merge_all(cls, evidences):
+        """
+        Merges any number of evidence collections in one go. The result is
+        the same as adding the collections one by one, but each merged
+        evidence is created only once, not at every step of the merging.
+
+        :arg iterable evidences:
+            :py:class:`Evidences` instances.
+        """
+
+        by_key = {}
+
+        for evs in evidences:
+
+            for key, ev in iteritems(evs.evidences):
+
+                by_key.setdefault(key, []).append(ev)
+
+        new = cls()
+        new.evidences = dict(
+            (key, cls._merge_same_resource(evs))
+            for key, evs in iteritems(by_key)
+        )
+
+        return new
+
+
+    @staticmethod
+    def _merge_same_resource(evidences):
+        """
+        Merges a list of evidences from the same resource into a new
+        evidence.
+        """
+
+        merged = evidences[0].__copy__()
+
+        for ev in evidences[1:]:
+
+            merged.dataset = netres.choose_dataset(merged.dataset, ev.dataset)
+            merged.references.update(ev.references)
+            merged.update_attrs(ev.attrs.copy())
+
+        return merged
+
+
     def __sub__(self, other):
 
         return Evidences(
@@ -562,7 +622,7 @@ class Evidences(object):
 
     def __bool__(self):
 
-        return bool(len(self.evidences))
+        return bool(self.evidences)
 
 
     def __contains__(self, other):
@@ -585,6 +645,22 @@ class Evidences(object):
         return this & other
 
 
+    def intersects(self, other):
+        """
+        Tells if any of the resources in ``other`` supports this collection
+        of evidences. Equivalent to ``bool(self & other)``, but stops at the
+        first match instead of building the intersection.
+        """
+
+        other = self._foreign_resources_set(other)
+        by_name = all(isinstance(res, str) for res in other)
+
+        return any(
+            (ev.resource.name if by_name else ev.resource) in other
+            for ev in self
+        )
+
+
     def __or__(self, other):
 
         other = self._foreign_resources_set(other)
@@ -632,7 +708,7 @@ class Evidences(object):
 
     def count_resources(self, **kwargs):
 
-        return len(list(self.filter(**kwargs)))
+        return sum(1 for _ in self.filter(**kwargs))
 
 
     def get_resources(self, **kwargs):
@@ -666,13 +742,10 @@ class Evidences(object):
 
     def get_references(self, **kwargs):
 
-        evidences = self.filter(**kwargs)
-
-        return {
-            ref
-            for ev in evidences
-            for ref in ev.references
-        }
+        return set().union(*(
+            ev.references
+            for ev in self.filter(**kwargs)
+        ))
 
 
     def count_curation_effort(self, **kwargs):
@@ -810,6 +883,69 @@ class Evidences(object):
         )
 
 
+    @staticmethod
+    def count_pos_neg(
+            positive,
+            negative,
+            by = 'curation_effort',
+            interaction_type = None,
+            via = False,
+        ):
+        """
+        Counts the resources, references or curation effort in two
+        collections of evidences, typically the positive and negative
+        evidences of one direction. The filters depend only on the resource,
+        hence each resource present in both collections is matched only once.
+
+        :arg str by:
+            What to count: ``resources``, ``references`` or
+            ``curation_effort``.
+        :arg str,set,NoneType interaction_type:
+            Filter by interaction type.
+        :arg bool,str,NoneType via:
+            Filter by secondary resources.
+
+        :return:
+            Tuple of two integers: the counts in the two collections.
+        """
+
+        matches = {}
+        result = []
+
+        for evs in (positive, negative):
+
+            counted = set()
+
+            for key, ev in iteritems(evs.evidences):
+
+                if key not in matches:
+
+                    matches[key] = ev.match(
+                        interaction_type = interaction_type,
+                        via = via,
+                    )
+
+                if not matches[key]:
+
+                    continue
+
+                if by == 'resources':
+
+                    counted.add(key)
+
+                elif by == 'references':
+
+                    counted.update(ev.references)
+
+                else:
+
+                    counted.update((ev.resource, ref) for ref in ev.references)
+
+            result.append(len(counted))
+
+        return tuple(result)
+
+
     def filter(
             self,
             resource = None,
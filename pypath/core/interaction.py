@@ -34,6 +34,7 @@ from typing import Literal
 import importlib as imp
 import collections
 import operator
+import sys
 import itertools
 import functools
 import json
@@ -50,6 +51,43 @@ import pypath.utils.orthology as orthology
 _logger = session_mod.Logger(name = 'interaction')
 _log = _logger._log
 
+_POSITIVE_EFFECTS = frozenset((1, 'positive', 'stimulation'))
+_NEGATIVE_EFFECTS = frozenset((-1, 'negative', 'inhibition'))
+_UNKNOWN_EFFECTS = frozenset((0, 'unknown'))
+# indexed by the presence of positive and negative evidences
+# as the two bits of an integer
+_SIGN_GLYPHS = ('====', '(-)=', '(+)=', '(+-)')
+# number of values cached by `_rev_cached` for each method of each
+# interaction: a few recent results, not all the queries ever made on
+# the interaction
+_REV_CACHE_SIZE = 4
+# the key of undirected evidences; the direction keys normalized by
+# `direction_key` are always this very object, hence can be tested
+# by identity
+_UNDIRECTED = sys.intern('undirected')
+# functions to convert the evidences to the answer type requested
+# from the query methods
+_ANSWER_EVIDENCES = common.identity
+_ANSWER_RESOURCES = operator.methodcaller('get_resources')
+_ANSWER_RESOURCE_NAMES = operator.methodcaller('get_resource_names')
+_ANSWER_BOOL = bool
+# the node attributes which can be changed by `Interaction.translate`:
+# the argument name, the entity attribute and the node label
+_TRANSLATE_ATTRS = tuple(
+    ('%s_%s' % (attr, label), attr, label)
+    for attr in ('id_type', 'entity_type', 'taxon')
+    for label in ('a', 'b')
+)
+_EFFECT_SYNONYMS = {
+    'positive': 'positive',
+    'stimulation': 'positive',
+    'stimulatory': 'positive',
+    'negative': 'negative',
+    'inhibition': 'negative',
+    'inhibitory': 'negative',
+    'unknown': 'unknown',
+}
+
 
 InteractionKey = collections.namedtuple(
     'InteractionKey',
@@ -78,6 +116,65 @@ InteractionDataFrameRecord = collections.namedtuple(
 InteractionDataFrameRecord.__new__.__defaults__ = (None,) * 8
 
 
+def _rev_cached(method = None, size = None):
+    """
+    Caches the return value of an :py:class:`Interaction` method. The
+    methods modifying the evidences increment the ``_rev`` attribute of the
+    interaction, all values cached at an earlier revision are dropped at
+    once. Each method has its own slot in the cache, with at most *size*
+    (by default ``_REV_CACHE_SIZE``) values, the oldest one is dropped
+    first. Thus the methods calling each other do not evict each other's
+    values. The cached objects are returned themselves, hence these must
+    be immutable, or copied by the caller.
+    """
+
+    if method is None:
+
+        return functools.partial(_rev_cached, size = size)
+
+    name = method.__name__
+    size = size or _REV_CACHE_SIZE
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+
+        key = (args, tuple(sorted(iteritems(kwargs))))
+        cache = self._cache
+
+        if cache is None or cache[0] != self._rev:
+
+            cache = self._cache = (self._rev, {})
+
+        results = cache[1].get(name)
+
+        if results is None:
+
+            results = cache[1][name] = {}
+
+        try:
+
+            if key in results:
+
+                return results[key]
+
+        except TypeError:
+
+            # unhashable arguments
+            return method(self, *args, **kwargs)
+
+        result = method(self, *args, **kwargs)
+
+        if len(results) >= size:
+
+            del results[next(iter(results))]
+
+        results[key] = result
+
+        return result
+
+    return wrapper
+
+
 class Interaction(attrs_mod.AttributeHandler):
     """
     Represents a unique pair of molecular entities interacting with each
@@ -105,14 +202,21 @@ class Interaction(attrs_mod.AttributeHandler):
         argument ``a`` becomes attribute ``b``.
     """
 
+    # `reload` replaces the class of existing instances, this works only
+    # if the reloaded class has the very same slots in the same order
     __slots__ = [
         'a',
         'b',
         'a_b',
         'b_a',
+        '_directed_keys',
+        '_entity_map',
         'nodes',
         'key',
+        '_hash',
         'evidences',
+        '_rev',
+        '_cache',
         'direction',
         'positive',
         'negative',
@@ -202,7 +306,7 @@ class Interaction(attrs_mod.AttributeHandler):
     )
 
     _degree_directions = {
-        'undirected': (None, None),
+        _UNDIRECTED: (None, None),
         'non_directed': (False, None),
         'directed': (True, None),
         'signed': (True, True),
@@ -258,15 +362,30 @@ class Interaction(attrs_mod.AttributeHandler):
         self.b = self.nodes[1]
 
         self.key = self._key
+        self._hash = hash(self.key)
 
         self.a_b = (self.nodes[0], self.nodes[1])
         self.b_a = (self.nodes[1], self.nodes[0])
+        self._directed_keys = self._make_directed_keys()
+        self._entity_map = self._make_entity_map()
+
+        self._init_evidences()
+
+        attrs_mod.AttributeHandler.__init__(self, attrs)
+
+
+    def _init_evidences(self):
+        """
+        Creates the empty evidence collections.
+        """
 
         self.evidences = pypath_evidence.Evidences()
+        self._rev = 0
+        self._cache = None
         self.direction = {
             self.a_b: pypath_evidence.Evidences(),
             self.b_a: pypath_evidence.Evidences(),
-            'undirected': pypath_evidence.Evidences(),
+            _UNDIRECTED: pypath_evidence.Evidences(),
         }
         self.positive = {
             self.a_b: pypath_evidence.Evidences(),
@@ -281,12 +400,18 @@ class Interaction(attrs_mod.AttributeHandler):
             self.b_a: pypath_evidence.Evidences(),
         }
 
-        attrs_mod.AttributeHandler.__init__(self, attrs)
-
 
-    def reload(self):
+    def reload(self, reload_modules = True):
         """
         Reloads the object from the module level.
+
+        :arg bool reload_modules:
+            Reload the modules of the interaction, evidence and entity
+            classes. If ``False``, only the classes of the objects are
+            replaced by the ones currently in the modules. This is enough
+            if the modules have already been reloaded, e.g. when reloading
+            a large number of interactions, reloading the modules only at
+            the first one.
         """
 
         modname = self.__class__.__module__
@@ -295,22 +420,28 @@ class Interaction(attrs_mod.AttributeHandler):
         mod = __import__(modname, fromlist = [modname.split('.')[0]])
         evmod = __import__(evmodname, fromlist = [evmodname.split('.')[0]])
         enmod = __import__(enmodname, fromlist = [enmodname.split('.')[0]])
-        imp.reload(mod)
-        imp.reload(evmod)
-        imp.reload(enmod)
+
+        if reload_modules:
+
+            imp.reload(mod)
+            imp.reload(evmod)
+            imp.reload(enmod)
+
         new = getattr(mod, self.__class__.__name__)
         evsnew = getattr(evmod, 'Evidences')
         evnew = getattr(evmod, 'Evidence')
         ennew = getattr(enmod, 'Entity')
         setattr(self, '__class__', new)
 
-        for evs in itertools.chain(
-            (self.evidences,),
-            self.direction.values(),
-            self.positive.values(),
-            self.negative.values(),
-            self.unknown_effect.values(),
-        ):
+        all_evidences = [
+            self.evidences,
+            *self.direction.values(),
+            *self.positive.values(),
+            *self.negative.values(),
+            *self.unknown_effect.values(),
+        ]
+
+        for evs in all_evidences:
 
             evs.__class__ = evsnew
 
@@ -321,9 +452,11 @@ class Interaction(attrs_mod.AttributeHandler):
         self.a.__class__ = ennew
         self.b.__class__ = ennew
 
-        self._generate_get_methods()
-        self._generate_count_methods()
-        self._generate_by_methods()
+        if reload_modules:
+
+            self._generate_get_methods()
+            self._generate_count_methods()
+            self._generate_by_methods()
 
 
     def _get_entity(
@@ -375,13 +508,41 @@ class Interaction(attrs_mod.AttributeHandler):
         """
 
         return (
-            direction == 'undirected' or (
+            direction == _UNDIRECTED or (
                 isinstance(direction, tuple) and
                 self._check_nodes_key(direction)
             )
         )
 
 
+    def _make_entity_map(self):
+        """
+        Creates a dict to look up the entities of this interaction by
+        themselves, by their identifiers or by their labels. Used for
+        processing the direction keys. In case of a conflict entity ``a``
+        takes precedence, just like in ``id_to_entity``.
+        """
+
+        return dict(
+            (key, en)
+            for en in (self.b, self.a)
+            for key in (en.label, en.identifier, en)
+            if key is not None
+        )
+
+
+    def _make_directed_keys(self):
+        """
+        The keys of the two directions, or only one in case of loops.
+        """
+
+        return (
+            (self.a_b,)
+                if self.a_b == self.b_a else
+            (self.a_b, self.b_a)
+        )
+
+
     def id_to_entity(self, identifier):
 
         return (
@@ -400,15 +561,26 @@ class Interaction(attrs_mod.AttributeHandler):
         can be labels or identifiers.
         """
 
-        if direction == 'undirected':
+        if direction == _UNDIRECTED:
+
+            return _UNDIRECTED
+
+        try:
+
+            src, tgt = direction
+            direction = (self._entity_map[src], self._entity_map[tgt])
 
-            return direction
+        except (KeyError, TypeError, ValueError):
 
-        direction = tuple(map(self.id_to_entity, direction))
+            return None
 
+        # returning the very same tuple objects which are the keys in the
+        # evidence dicts makes the lookups faster
         return (
-            direction
-                if direction == self.a_b or direction == self.b_a else
+            self.a_b
+                if direction == self.a_b else
+            self.b_a
+                if direction == self.b_a else
             None
         )
 
@@ -416,9 +588,9 @@ class Interaction(attrs_mod.AttributeHandler):
     @staticmethod
     def direction_key_identifiers(direction):
 
-        if direction == 'undirected':
+        if direction == _UNDIRECTED:
 
-            return direction
+            return _UNDIRECTED
 
         return tuple(ent.identifier for ent in direction)
 
@@ -426,13 +598,13 @@ class Interaction(attrs_mod.AttributeHandler):
     @staticmethod
     def _directed_key(direction):
 
-        return direction is not None and direction != 'undirected'
+        return direction is not None and direction is not _UNDIRECTED
 
 
     def add_evidence(
             self,
             evidence,
-            direction = 'undirected',
+            direction = _UNDIRECTED,
             effect = None,
             references = None,
             attrs = None,
@@ -490,31 +662,59 @@ class Interaction(attrs_mod.AttributeHandler):
             evidence.update_attrs(attrs)
 
         self.evidences += evidence
+        self._rev += 1
         self.direction[direction] += evidence
 
-        if direction != 'undirected':
+        if direction is not _UNDIRECTED:
 
-            if effect in {1, 'positive', 'stimulation'}:
+            if effect in _POSITIVE_EFFECTS:
 
                 self.positive[direction] += evidence
 
-            elif effect in {-1, 'negative', 'inhibition'}:
+            elif effect in _NEGATIVE_EFFECTS:
 
                 self.negative[direction] += evidence
 
-            elif effect in {0, 'unknown'}:
+            elif effect in _UNKNOWN_EFFECTS:
 
                 self.unknown_effect[direction] += evidence
 
 
     def __hash__(self):
 
-        return hash(self.key)
+        return self._hash
 
 
     def __eq__(self, other):
 
-        return hasattr(other, 'key') and self.key == other.key
+        return (
+            self is other or
+            (hasattr(other, 'key') and self.key == other.key)
+        )
+
+
+    def __setstate__(self, state):
+
+        # the hash of strings is different in each interpreter session,
+        # hence the cached hash must be computed again after unpickling
+        for _state in (state if isinstance(state, tuple) else (state,)):
+
+            for attr, value in iteritems(_state or {}):
+
+                setattr(self, attr, value)
+
+        self._hash = hash(self.key)
+        self._rev = 0
+        self._cache = None
+
+        # instances pickled by earlier versions lack these attributes
+        if not hasattr(self, '_directed_keys'):
+
+            self._directed_keys = self._make_directed_keys()
+
+        if not hasattr(self, '_entity_map'):
+
+            self._entity_map = self._make_entity_map()
 
 
     @property
@@ -553,7 +753,21 @@ class Interaction(attrs_mod.AttributeHandler):
 
     def __copy__(self):
 
-        new = Interaction(*self.key)
+        # the entities and the keys derived from them are immutable,
+        # hence we don't need to create them again by `__init__`
+        new = self.__class__.__new__(self.__class__)
+        new.nodes = self.nodes
+        new.a = self.a
+        new.b = self.b
+        new.key = self.key
+        new._hash = self._hash
+        new.a_b = self.a_b
+        new.b_a = self.b_a
+        new._directed_keys = self._directed_keys
+        new._entity_map = self._entity_map
+        new._init_evidences()
+        attrs_mod.AttributeHandler.__init__(new)
+
         new += self
         new.update_attrs(self)
 
@@ -563,23 +777,21 @@ class Interaction(attrs_mod.AttributeHandler):
     @staticmethod
     def _merge_evidences(one, other):
 
-        one.evidences += other.evidences
-
-        for dir_key in one.direction.keys():
-
-            one.direction[dir_key] += other.direction[dir_key]
+        a_b = one.a_b
+        b_a = one.b_a
 
-        for eff_key in one.positive.keys():
-
-            one.positive[eff_key] += other.positive[eff_key]
-
-        for eff_key in one.negative.keys():
-
-            one.negative[eff_key] += other.negative[eff_key]
-
-        for eff_key in one.unknown_effect.keys():
+        one.evidences += other.evidences
+        one._rev += 1
 
-            one.unknown_effect[eff_key] += other.unknown_effect[eff_key]
+        one.direction[a_b] += other.direction[a_b]
+        one.direction[b_a] += other.direction[b_a]
+        one.direction[_UNDIRECTED] += other.direction[_UNDIRECTED]
+        one.positive[a_b] += other.positive[a_b]
+        one.positive[b_a] += other.positive[b_a]
+        one.negative[a_b] += other.negative[a_b]
+        one.negative[b_a] += other.negative[b_a]
+        one.unknown_effect[a_b] += other.unknown_effect[a_b]
+        one.unknown_effect[b_a] += other.unknown_effect[b_a]
 
 
     def __repr__(self):
@@ -595,28 +807,21 @@ class Interaction(attrs_mod.AttributeHandler):
         return '%s %s=%s=%s=%s %s' % (
             self.a.label or self.a.identifier,
             '<' if self.direction[self.b_a] else '=',
-            (
-                '(+-)' if (
-                    self.positive[self.b_a] and
-                    self.negative[self.b_a]
-                ) else
-                '(+)=' if self.positive[self.b_a] else
-                '(-)=' if self.negative[self.b_a] else
-                '===='
-            ),
-            (
-                '(+-)' if (
-                    self.positive[self.a_b] and
-                    self.negative[self.a_b]
-                ) else
-                '(+)=' if self.positive[self.a_b] else
-                '(-)=' if self.negative[self.a_b] else
-                '===='
-            ),
+            self._sign_glyph(self.b_a),
+            self._sign_glyph(self.a_b),
             '>' if self.direction[self.a_b] else '=',
             self.b.label or self.b.identifier,
         )
 
+
+    def _sign_glyph(self, direction):
+
+        return _SIGN_GLYPHS[
+            bool(self.positive[direction]) << 1 |
+            bool(self.negative[direction])
+        ]
+
+
     def __contains__(self, other):
 
         return (
@@ -635,10 +840,17 @@ class Interaction(attrs_mod.AttributeHandler):
     @property
     def data_models(self):
 
-        return {
+        # a new set, as the callers might modify it
+        return set(self._data_models())
+
+
+    @_rev_cached
+    def _data_models(self):
+
+        return frozenset(
             ev.resource.data_model
             for ev in self.evidences
-        }
+        )
 
 
     def has_dataset(
@@ -687,10 +899,10 @@ class Interaction(attrs_mod.AttributeHandler):
 
             return self._select_answer_type(
                 self.direction[direction],
-                resources = resources,
-                evidences = evidences,
-                resource_names = resource_names,
-                sources = sources,
+                resources,
+                evidences,
+                resource_names,
+                sources,
             )
 
         else:
@@ -724,30 +936,21 @@ class Interaction(attrs_mod.AttributeHandler):
 
         query = (src, tgt)
 
-        answer_type_args = {
-            'resources': resources,
-            'evidences': evidences,
-            'resource_names': resource_names,
-            'sources': sources,
-        }
-
         query = self.direction_key(query)
 
         if query is not None:
 
+            answer_type = self._answer_type(
+                resources,
+                evidences,
+                resource_names,
+                sources,
+            )
+
             return [
-                self._select_answer_type(
-                    self.direction[query],
-                    **answer_type_args
-                ),
-                self._select_answer_type(
-                    self.direction[tuple(reversed(query))],
-                    **answer_type_args
-                ),
-                self._select_answer_type(
-                    self.direction['undirected'],
-                    **answer_type_args
-                ),
+                answer_type(self.direction[query]),
+                answer_type(self.direction[tuple(reversed(query))]),
+                answer_type(self.direction[_UNDIRECTED]),
             ]
 
         else:
@@ -763,17 +966,39 @@ class Interaction(attrs_mod.AttributeHandler):
             sources = False,
         ):
 
+        return self._answer_type(
+            resources,
+            evidences,
+            resource_names,
+            sources,
+        )(answer)
+
+
+    @staticmethod
+    def _answer_type(
+            resources = False,
+            evidences = False,
+            resource_names = False,
+            sources = False,
+        ):
+        """
+        Selects the function which converts the evidences to the type of
+        answer requested. Methods which return more than one answer should
+        call this once and apply the function on each answer.
+        """
+
         return (
-            answer
+            _ANSWER_EVIDENCES
                 if evidences else
-            answer.get_resources()
+            _ANSWER_RESOURCES
                 if resources else
-            answer.get_resource_names()
+            _ANSWER_RESOURCE_NAMES
                 if sources or resource_names else
-            bool(answer)
+            _ANSWER_BOOL
         )
 
 
+    @_rev_cached
     def which_directions(
             self,
             resources = None,
@@ -797,23 +1022,41 @@ class Interaction(attrs_mod.AttributeHandler):
 
         resources = self._resources_set(resources)
         effect = self._effect_synonyms(effect)
+        effect_evidences = None
+        result = []
 
-        return tuple(
-            _dir
-            for _dir, _evidences in iteritems(self.direction)
-            if _dir != 'undirected' and
-            _evidences and (
-                not resources or
-                _evidences & resources
-            ) and (
-                not effect
-                or (
-                    not resources and
-                    getattr(self, effect)[_dir]
-                ) or
-                getattr(self, effect)[_dir] & resources
-            )
-        )
+        for _dir in self._directed_keys:
+
+            _evidences = self.direction[_dir]
+
+            if not _evidences:
+
+                continue
+
+            if resources and not _evidences.intersects(resources):
+
+                continue
+
+            if effect:
+
+                # looked up only once, and only if any direction
+                # passed the filters above
+                effect_evidences = (
+                    effect_evidences or
+                    getattr(self, effect)
+                )
+
+                if not (
+                    effect_evidences[_dir].intersects(resources)
+                        if resources else
+                    effect_evidences[_dir]
+                ):
+
+                    continue
+
+            result.append(_dir)
+
+        return tuple(result)
 
 
     # synonym: old name
@@ -842,16 +1085,24 @@ class Interaction(attrs_mod.AttributeHandler):
         resources = self._resources_set(resources)
         effect = self._effect_synonyms(effect)
         effects = (effect,) if effect else ('positive', 'negative')
+        result = []
 
-        return tuple(
-            (_dir, _effect)
-            for _effect in effects
-            for _dir, _evidences in iteritems(getattr(self, _effect))
-            if _evidences and (
-                not resources or
-                _evidences & resources
-            )
-        )
+        for _effect in effects:
+
+            effect_evidences = getattr(self, _effect)
+
+            for _dir in self._directed_keys:
+
+                _evidences = effect_evidences[_dir]
+
+                if _evidences and (
+                    not resources or
+                    _evidences.intersects(resources)
+                ):
+
+                    result.append((_dir, _effect))
+
+        return tuple(result)
 
 
     @staticmethod
@@ -861,24 +1112,38 @@ class Interaction(attrs_mod.AttributeHandler):
 
             return effect
 
-        if effect in {'positive', 'stimulation', 'stimulatory'}:
+        return _EFFECT_SYNONYMS.get(effect)
 
-            return 'positive'
 
-        if effect in {'negative', 'inhibition', 'inhibitory'}:
+    def _resources_set(self, resources = None):
 
-            return 'negative'
+        if isinstance(resources, (str, tuple, frozenset)):
 
-        if effect in {'unknown'}:
+            try:
 
-            return 'unknown'
+                return self._resources_set_cached(resources)
 
+            except TypeError:
 
-    def _resources_set(self, resources = None):
+                # a tuple with unhashable elements, converted
+                # without the cache
+                pass
 
         return common.to_set(resources)
 
 
+    @staticmethod
+    @functools.lru_cache(maxsize = 256)
+    def _resources_set_cached(resources):
+        """
+        Queries often pass the same resources for each interaction in a
+        network, hence we convert each hashable value only once. Frozen
+        sets are returned as the same object is shared between calls.
+        """
+
+        return frozenset(common.to_set(resources))
+
+
     def unset_direction(
             self,
             direction,
@@ -929,6 +1194,8 @@ class Interaction(attrs_mod.AttributeHandler):
                         pypath_evidence.Evidences()
                     )
 
+            self._rev += 1
+
 
     # synonym: old name
     unset_dir = unset_direction
@@ -984,6 +1251,8 @@ class Interaction(attrs_mod.AttributeHandler):
 
                 self.evidences -= ev
 
+        self._rev += 1
+
         for attr in ('direction', 'positive', 'negative'):
 
             for key, evs in getattr(self, attr):
@@ -1005,10 +1274,9 @@ class Interaction(attrs_mod.AttributeHandler):
             ``False`` otherwise.
         """
 
-        return any(
-            evs
-            for dkey, evs in iteritems(self.direction)
-            if dkey != 'undirected'
+        return bool(
+            self.direction[self.a_b] or
+            self.direction[self.b_a]
         )
 
 
@@ -1083,7 +1351,7 @@ class Interaction(attrs_mod.AttributeHandler):
         """
 
         return self._is_effect(
-            sign = 'positive',
+            'positive',
             direction = direction,
             resources = resources,
         )
@@ -1105,27 +1373,30 @@ class Interaction(attrs_mod.AttributeHandler):
         """
 
         return self._is_effect(
-            sign = 'negative',
+            'negative',
             direction = direction,
             resources = resources,
         )
 
 
-    def _is_effect(self, sign, direction = None, resources = None):
+    def _is_effect(self, *signs, direction = None, resources = None):
+        """
+        Checks if the interaction has evidences with any of the *signs*
+        (``'positive'`` or ``'negative'``), optionally in one direction
+        and from certain resources.
+        """
 
-        _sign = getattr(self, sign)
         _resources = self._resources_set(resources)
 
-        return (
-            any(
-                bool(
-                    _evidences
-                        if not _resources else
-                    _evidences & _resources
-                )
-                for _direction, _evidences in iteritems(_sign)
-                if not direction or direction == _direction
+        return any(
+            bool(
+                _evidences
+                    if not _resources else
+                _evidences.intersects(_resources)
             )
+            for sign in signs
+            for _direction, _evidences in iteritems(getattr(self, sign))
+            if not direction or direction == _direction
         )
 
 
@@ -1143,10 +1414,11 @@ class Interaction(attrs_mod.AttributeHandler):
               sign of the interaction, ``False`` otherwise.
         """
 
-        return (
-            self.is_stimulation(direction = direction, resources = resources)
-                or
-            self.is_inhibition(direction = direction, resources = resources)
+        return self._is_effect(
+            'positive',
+            'negative',
+            direction = direction,
+            resources = resources,
         )
 
 
@@ -1158,6 +1430,7 @@ class Interaction(attrs_mod.AttributeHandler):
             resource_name: str = None,
             interaction_type: str = 'PPI',
             data_model: str = None,
+            references: set[str] | None = None,
             attrs: dict = None,
             **kwargs
         ):
@@ -1179,6 +1452,9 @@ class Interaction(attrs_mod.AttributeHandler):
             resource:
                 Contains the name(s) of the source(s) from which the
                 information was obtained.
+            references:
+                A set of references, used only if the resource is not
+                already an ``Evidence`` object.
             attrs:
                 Custom (resource specific) edge attributes.
             kwargs:
@@ -1188,35 +1464,46 @@ class Interaction(attrs_mod.AttributeHandler):
         """
 
         sign = self._effect_synonyms(sign)
+        direction = self.direction_key(direction)
+
+        if not self._directed_key(direction):
+
+            return
+
+        resource_name = (
+            resource
+                if resource_name is None and isinstance(resource, str) else
+            resource_name
+        )
 
         evidence = (
             resource
-                if isinstance(resource, pypath_evidence.Evidence) else
-            pypath_evidence.Evidence(
-                resource = resource,
-                references = references,
-            )
-                if isinstance(resource, pypath_resource.NetworkResource) else
-            pypath_evidence.Evidence(
-                resource = pypath_resource.NetworkResource(
-                    name = resource_name,
-                    interaction_type = interaction_type,
-                    data_model = data_model,
-                    **kwargs
-                )
+                if isinstance(
+                    resource,
+                    (
+                        pypath_evidence.Evidence,
+                        pypath_resource.NetworkResource,
+                    )
+                ) else
+            pypath_resource.NetworkResource(
+                name = resource_name,
+                interaction_type = interaction_type,
+                data_model = data_model,
+                **kwargs
             )
                 if resource_name is not None else
             None
         )
 
-        evidence.update_attrs(attrs)
-
-        direction = self.direction_key(direction)
-
-        if self._directed_key(direction) and evidence is not None:
+        if evidence is not None:
 
-            ev_attr = getattr(self, sign)
-            ev_attr += evidence
+            self.add_evidence(
+                evidence = evidence,
+                direction = direction,
+                effect = sign,
+                references = references,
+                attrs = attrs,
+            )
 
 
     def get_sign(
@@ -1256,35 +1543,26 @@ class Interaction(attrs_mod.AttributeHandler):
 
         sign = self._effect_synonyms(sign)
 
-        answer_type_args = {
-            'resources': resources,
-            'evidences': evidences,
-            'resource_names': resource_names,
-            'sources': sources,
-        }
-
         direction = self.direction_key(direction)
 
         if self._directed_key(direction):
 
+            answer_type = self._answer_type(
+                resources,
+                evidences,
+                resource_names,
+                sources,
+            )
+
             return (
 
-                self._select_answer_type(
-                    getattr(self, sign)[direction],
-                    **answer_type_args
-                )
+                answer_type(getattr(self, sign)[direction])
 
                     if sign else
 
                 [
-                    self._select_answer_type(
-                        self.positive[direction],
-                        **answer_type_args
-                    ),
-                    self._select_answer_type(
-                        self.negative[direction],
-                        **answer_type_args
-                    )
+                    answer_type(self.positive[direction]),
+                    answer_type(self.negative[direction]),
                 ]
 
             )
@@ -1365,37 +1643,28 @@ class Interaction(attrs_mod.AttributeHandler):
         ):
 
         resources = self._resources_set(resources)
-        _slice = slice(0, 1) if source_target == 'source' else slice(1, 2)
-
-        return tuple(itertools.chain(
-            (
-                _direction[_slice]
-                    if _direction != 'undirected' else
-                self.nodes
-                    if undirected else
-                ()
+        idx = 0 if source_target == 'source' else 1
+        match = (
+            bool
+                if not resources and not kwargs else
+            lambda _evidences: any(
+                ev.match_any(resources, **kwargs)
+                for ev in _evidences
             )
-            for _direction, _evidences in iteritems(self.direction)
-            if (
-                (
-                    (
-                        not resources and
-                        not kwargs and
-                        bool(_evidences)
-                    ) or
-                    (
-                        any(
-                            ev.match(
-                                resource = res,
-                                **kwargs
-                            )
-                            for res in resources or (None,)
-                            for ev in _evidences
-                        )
-                    )
-                )
-            )
-        ))
+        )
+        result = []
+
+        for _dir in self._directed_keys:
+
+            if match(self.direction[_dir]):
+
+                result.append((_dir[idx],))
+
+        if match(self.direction[_UNDIRECTED]):
+
+            result.append(self.nodes if undirected else ())
+
+        return tuple(result)
 
 
     def src_by_resource(self, resource):
@@ -1415,14 +1684,7 @@ class Interaction(attrs_mod.AttributeHandler):
             found or invalid, an empty list will be returned.
         """
 
-        return [
-            _dir[0]
-            for _dir, _evidences in iteritems(self.direction)
-            if (
-                _dir != 'undirected' and
-                resource in _evidences
-            )
-        ]
+        return [_dir[0] for _dir in self._dirs_by_resource(resource)]
 
 
     def tgt_by_resource(self, resource):
@@ -1442,14 +1704,49 @@ class Interaction(attrs_mod.AttributeHandler):
             found or invalid, an empty list will be returned.
         """
 
-        return [
-            _dir[1]
-            for _dir, _evidences in iteritems(self.direction)
-            if (
-                _dir != 'undirected' and
-                resource in _evidences
-            )
-        ]
+        return [_dir[1] for _dir in self._dirs_by_resource(resource)]
+
+
+    def _dirs_by_resource(self, resource):
+        """
+        The directed keys supported by a resource. Resource names are
+        looked up in an index, anything else (e.g. references or tuples of
+        resource names and interaction types) is checked by the evidences.
+        """
+
+        return (
+            self._resource_index.get(resource, ())
+                if isinstance(resource, str) and not resource.isdigit() else
+            [
+                _dir
+                for _dir in self._directed_keys
+                if resource in self.direction[_dir]
+            ]
+        )
+
+
+    @property
+    @_rev_cached
+    def _resource_index(self):
+        """
+        Directed keys by the names of the primary resources supporting them.
+        """
+
+        index = {}
+
+        for _dir in self._directed_keys:
+
+            for ev in self.direction[_dir]:
+
+                if not ev.resource.via:
+
+                    dirs = index.setdefault(ev.resource.name, [])
+
+                    if not dirs or dirs[-1] != _dir:
+
+                        dirs.append(_dir)
+
+        return index
 
 
     def resources_a_b(
@@ -1468,16 +1765,12 @@ class Interaction(attrs_mod.AttributeHandler):
             :py:attr:`a_b` directionality of the edge.
         """
 
-        answer_type_args = {
-            'resources': resources,
-            'evidences': evidences,
-            'resource_names': resource_names,
-            'sources': sources,
-        }
-
         return self._select_answer_type(
             self.direction[self.a_b],
-            **answer_type_args
+            resources,
+            evidences,
+            resource_names,
+            sources,
         )
 
 
@@ -1500,16 +1793,12 @@ class Interaction(attrs_mod.AttributeHandler):
             :py:attr:`b_a` directionality of the edge.
         """
 
-        answer_type_args = {
-            'resources': resources,
-            'evidences': evidences,
-            'resource_names': resource_names,
-            'sources': sources,
-        }
-
         return self._select_answer_type(
             self.direction[self.b_a],
-            **answer_type_args
+            resources,
+            evidences,
+            resource_names,
+            sources,
         )
 
 
@@ -1533,16 +1822,12 @@ class Interaction(attrs_mod.AttributeHandler):
             information.
         """
 
-        answer_type_args = {
-            'resources': resources,
-            'evidences': evidences,
-            'resource_names': resource_names,
-            'sources': sources,
-        }
-
         return self._select_answer_type(
-            self.direction['undirected'],
-            **answer_type_args
+            self.direction[_UNDIRECTED],
+            resources,
+            evidences,
+            resource_names,
+            sources,
         )
 
 
@@ -1628,14 +1913,11 @@ class Interaction(attrs_mod.AttributeHandler):
             negative sign.
         """
 
-        answer_type_args = {
-            'resource_names': True
-        }
-        answer_type_args.update(kwargs)
+        kwargs.setdefault('resource_names', True)
 
         return self._select_answer_type(
             self.negative[self.a_b],
-            **answer_type_args
+            **kwargs
         )
 
 
@@ -1650,14 +1932,11 @@ class Interaction(attrs_mod.AttributeHandler):
             negative sign.
         """
 
-        answer_type_args = {
-            'resource_names': True
-        }
-        answer_type_args.update(kwargs)
+        kwargs.setdefault('resource_names', True)
 
         return self._select_answer_type(
             self.negative[self.b_a],
-            **answer_type_args
+            **kwargs
         )
 
 
@@ -1672,14 +1951,11 @@ class Interaction(attrs_mod.AttributeHandler):
             positive sign.
         """
 
-        answer_type_args = {
-            'resource_names': True
-        }
-        answer_type_args.update(kwargs)
+        kwargs.setdefault('resource_names', True)
 
         return self._select_answer_type(
             self.positive[self.a_b],
-            **answer_type_args
+            **kwargs
         )
 
 
@@ -1694,17 +1970,15 @@ class Interaction(attrs_mod.AttributeHandler):
             positive sign.
         """
 
-        answer_type_args = {
-            'resource_names': True
-        }
-        answer_type_args.update(kwargs)
+        kwargs.setdefault('resource_names', True)
 
         return self._select_answer_type(
             self.positive[self.b_a],
-            **answer_type_args
+            **kwargs
         )
 
 
+    @_rev_cached
     def majority_dir(
             self,
             only_interaction_type = None,
@@ -1730,7 +2004,7 @@ class Interaction(attrs_mod.AttributeHandler):
 
         if not a_b and not b_a:
 
-            return 'undirected'
+            return _UNDIRECTED
 
         method = (
             'count_references'
@@ -1739,18 +2013,19 @@ class Interaction(attrs_mod.AttributeHandler):
                 if by_reference_resource_pairs else
             'count_resources'
         )
-
-        n_a_b = getattr(a_b, method)(
-            interaction_type = only_interaction_type,
-            via = False if only_primary else None,
-        )
-        n_b_a = getattr(b_a, method)(
+        count = operator.methodcaller(
+            method,
             interaction_type = only_interaction_type,
             via = False if only_primary else None,
         )
 
+        # most edges have evidences only in one direction, there is
+        # nothing to count in the other one
+        n_a_b = count(a_b) if a_b else 0
+        n_b_a = count(b_a) if b_a else 0
+
         return (
-            'undirected'
+            _UNDIRECTED
                 if n_a_b == 0 and n_b_a == 0 else
             None
                 if n_a_b == n_b_a else
@@ -1782,33 +2057,60 @@ class Interaction(attrs_mod.AttributeHandler):
             equal.
         """
 
-        result = {}
+        # the cached value is shared, the caller gets a new dict
+        return dict(
+            (_dir, list(signs))
+            for _dir, signs in self._majority_sign(
+                only_interaction_type = only_interaction_type,
+                only_primary = only_primary,
+                by_references = by_references,
+                by_reference_resource_pairs = by_reference_resource_pairs,
+            )
+        )
 
-        method = (
-            'count_references'
+
+    @_rev_cached
+    def _majority_sign(
+            self,
+            only_interaction_type = None,
+            only_primary = True,
+            by_references = False,
+            by_reference_resource_pairs = True,
+        ):
+        """
+        The major signs of the two directions in a tuple of pairs, see
+        :py:meth:`majority_sign`.
+        """
+
+        result = []
+
+        by = (
+            'references'
                 if by_references else
-            'count_curation_effort'
+            'curation_effort'
                 if by_reference_resource_pairs else
-            'count_resources'
+            'resources'
         )
 
         for _dir in (self.a_b, self.b_a):
 
-            n_pos = getattr(self.positive[_dir], method)(
-                interaction_type = only_interaction_type,
-                via = False if only_primary else None,
-            )
-            n_neg = getattr(self.negative[_dir], method)(
+            n_pos, n_neg = pypath_evidence.Evidences.count_pos_neg(
+                self.positive[_dir],
+                self.negative[_dir],
+                by = by,
                 interaction_type = only_interaction_type,
                 via = False if only_primary else None,
             )
 
-            result[_dir] = [
-                0 < n_pos >= n_neg,
-                0 < n_neg >= n_pos,
-            ]
+            result.append((
+                _dir,
+                (
+                    0 < n_pos >= n_neg,
+                    0 < n_neg >= n_pos,
+                ),
+            ))
 
-        return result
+        return tuple(result)
 
 
     def consensus(
@@ -1829,6 +2131,30 @@ class Interaction(attrs_mod.AttributeHandler):
             ``['<source>', '<target>', '<(un)directed>', '<sign>']``
         """
 
+        # the cached value is shared, the caller gets new lists
+        return [
+            list(edge)
+            for edge in self._consensus(
+                only_interaction_type = only_interaction_type,
+                only_primary = only_primary,
+                by_references = by_references,
+                by_reference_resource_pairs = by_reference_resource_pairs,
+            )
+        ]
+
+
+    @_rev_cached
+    def _consensus(
+            self,
+            only_interaction_type = None,
+            only_primary = False,
+            by_references = False,
+            by_reference_resource_pairs = True,
+        ):
+        """
+        The consensus edges in a tuple of tuples, see :py:meth:`consensus`.
+        """
+
         result = []
 
         _dir = self.majority_dir(
@@ -1838,7 +2164,7 @@ class Interaction(attrs_mod.AttributeHandler):
             by_reference_resource_pairs = by_reference_resource_pairs,
         )
 
-        if _dir == 'undirected' or _dir is None:
+        if _dir is _UNDIRECTED or _dir is None:
 
             _dir = self.majority_dir(
                 only_interaction_type = only_interaction_type,
@@ -1847,27 +2173,27 @@ class Interaction(attrs_mod.AttributeHandler):
                 by_reference_resource_pairs = False,
             )
 
-        _effect = self.majority_sign(
+        _effect = dict(self._majority_sign(
             only_interaction_type = only_interaction_type,
             only_primary = only_primary,
             by_references = by_references,
             by_reference_resource_pairs = by_reference_resource_pairs,
-        )
-        _effect_noref = self.majority_sign(
+        ))
+        _effect_noref = dict(self._majority_sign(
             only_interaction_type = only_interaction_type,
             only_primary = only_primary,
             by_references = False,
             by_reference_resource_pairs = False,
-        )
+        ))
 
-        if _dir == 'undirected':
+        if _dir is _UNDIRECTED:
 
-            result.append([
+            result.append((
                 self.a_b[0],
                 self.a_b[1],
-                'undirected',
+                _UNDIRECTED,
                 'unknown',
-            ])
+            ))
 
         else:
 
@@ -1889,45 +2215,80 @@ class Interaction(attrs_mod.AttributeHandler):
                     # index #0 is positive
                     if d_effect[0]:
 
-                        result.append([
+                        result.append((
                             d[0],
                             d[1],
                             'directed',
                             'positive',
-                        ])
+                        ))
 
                     # can not be elif bc of the case of equal weight of
                     # evidences for both positive and negative
                     if d_effect[1]:
 
-                        result.append([
+                        result.append((
                             d[0],
                             d[1],
                             'directed',
                             'negative',
-                        ])
+                        ))
 
                 # directed with unknown effect
                 else:
 
-                    result.append([
+                    result.append((
                         d[0],
                         d[1],
                         'directed',
                         'unknown',
-                    ])
+                    ))
 
-        return result
+        return tuple(result)
 
 
     consensus_edges = consensus
 
 
+    @staticmethod
+    def consensus_records(interactions, **kwargs):
+        """
+        Infers the consensus edges of many interactions and returns them
+        in a record array, one column for each field of the edges.
+
+        :arg iterable interactions:
+            ``Interaction`` objects.
+        :arg kwargs:
+            Passed to :py:meth:`consensus`.
+
+        :return:
+            (*numpy.recarray*) -- With the fields ``source`` and ``target``
+            (identifiers of the entities), ``directed`` and ``sign``, the
+            same values as in the lists returned by :py:meth:`consensus`.
+            The string widths are adjusted to the longest value, hence
+            nothing is truncated.
+        """
+
+        import numpy as np
+
+        rows = [
+            (src.identifier, tgt.identifier, directed, sign)
+            for ia in interactions
+            for src, tgt, directed, sign in ia._consensus(**kwargs)
+        ]
+        columns = list(zip(*rows)) if rows else [()] * 4
+
+        return np.rec.fromarrays(
+            [np.array(column, dtype = str) for column in columns],
+            names = ('source', 'target', 'directed', 'sign'),
+        )
+
+
     def merge(self, other):
         """
         Merges current Interaction with another (if and only if they are the
         same class and contain the same nodes). Updates the attributes
-        :py:attr:`direction`, :py:attr:`positive` and :py:attr:`negative`.
+        :py:attr:`direction`, :py:attr:`positive`, :py:attr:`negative` and
+        :py:attr:`unknown_effect`.
 
         :arg pypath.interaction.Interaction other:
             The new Interaction object to be merged with the current one.
@@ -1942,18 +2303,7 @@ class Interaction(attrs_mod.AttributeHandler):
             )
             return
 
-        self.evidences += other.evidences
-
-        for attr, _dir in itertools.product(
-            ('direction', 'positive', 'negative'),
-            (self.a_b, self.b_a, 'undirected')
-        ):
-
-            if attr != 'direction' and _dir == 'undirected':
-
-                continue
-
-            getattr(self, attr)[_dir] += getattr(other, attr)[_dir]
+        self._merge_evidences(self, other)
 
 
     def translate(self, ids, new_attrs = None):
@@ -1984,7 +2334,7 @@ class Interaction(attrs_mod.AttributeHandler):
 
         all_new_attrs = dict(
             (
-                '%s_%s' % (attr, label),
+                arg,
                 new_attrs[new_ids[label]][attr]
                     if (
                         new_ids[label] in new_attrs and
@@ -1992,8 +2342,7 @@ class Interaction(attrs_mod.AttributeHandler):
                     ) else
                 getattr(getattr(self, label), attr)
             )
-            for attr in ('id_type', 'entity_type', 'taxon')
-            for label in ('a', 'b')
+            for arg, attr, label in _TRANSLATE_ATTRS
         )
 
         all_new_attrs['attrs'] = new_attrs.get('attrs', self.attrs)
@@ -2032,27 +2381,17 @@ class Interaction(attrs_mod.AttributeHandler):
             self.b_a
         )
 
-        for (old_dir, new_dir), attr in itertools.product(
-            zip(
-                (
-                    new_old_a_b,
-                    new_old_b_a,
-                    'undirected'
-                ),
-                (
-                    new.a_b,
-                    new.b_a,
-                    'undirected',
-                ),
-            ),
-            ('direction', 'positive', 'negative'),
+        for old_dir, new_dir in (
+            (new_old_a_b, new.a_b),
+            (new_old_b_a, new.b_a),
         ):
 
-            if old_dir == 'undirected' and attr != 'direction':
-
-                continue
+            new.direction[new_dir] += self.direction[old_dir]
+            new.positive[new_dir] += self.positive[old_dir]
+            new.negative[new_dir] += self.negative[old_dir]
+            new.unknown_effect[new_dir] += self.unknown_effect[old_dir]
 
-            getattr(new, attr)[new_dir] += getattr(self, attr)[old_dir]
+        new.direction[_UNDIRECTED] += self.direction[_UNDIRECTED]
 
         return new
 
@@ -2124,33 +2463,72 @@ class Interaction(attrs_mod.AttributeHandler):
             datasets = None,
         ):
 
+        if (
+            direction is None and
+            effect is None and
+            resources is None and
+            data_model is None and
+            interaction_type is None and
+            via is None and
+            references is None and
+            datasets is None
+        ):
+
+            # nothing to select or filter
+            return pypath_evidence.Evidences(self.evidences)
+
+        # a new object, as the callers might modify it
+        return pypath_evidence.Evidences(
+            self._get_evidences(
+                direction = direction,
+                effect = effect,
+                resources = resources,
+                data_model = data_model,
+                interaction_type = interaction_type,
+                via = via,
+                references = references,
+                datasets = datasets,
+            )
+        )
+
+
+    # the selected evidences are larger than the other cached values,
+    # hence fewer of them are kept
+    @_rev_cached(size = 2)
+    def _get_evidences(
+            self,
+            direction = None,
+            effect = None,
+            resources = None,
+            data_model = None,
+            interaction_type = None,
+            via = None,
+            references = None,
+            datasets = None,
+        ):
+        """
+        Selects and filters the evidences for ``get_evidences``. Returns
+        an ``Evidences`` object, or a tuple of ``Evidence`` objects if
+        filtered. The returned objects are cached, hence these must not
+        be modified.
+        """
+
         effect = self._effect_synonyms(effect)
 
         evidences = (
 
             # any signed
-            sum(itertools.chain(
-                self.positive.values(),
-                self.negative.values(),
-            ))
+            self._effect_evidences('positive', 'negative')
 
                 if effect == True else
 
             # only positive
-            (
-                self.positive[direction]
-                    if direction in self.positive else
-                sum(self.positive.values())
-            )
+            self._pick_direction('positive', direction)
 
                 if effect == 'positive' else
 
             # only negative
-            (
-                self.negative[direction]
-                    if direction in self.negative else
-                sum(self.negative.values())
-            )
+            self._pick_direction('negative', direction)
 
                 if effect == 'negative' else
 
@@ -2170,7 +2548,17 @@ class Interaction(attrs_mod.AttributeHandler):
         )
 
         return (
-            pypath_evidence.Evidences(
+            evidences
+                if (
+                    resources is None and
+                    data_model is None and
+                    interaction_type is None and
+                    via is None and
+                    references is None and
+                    datasets is None
+                ) else
+            # not copied here, the copy is made by `get_evidences`
+            tuple(
                 evidences.filter(
                     resource = resources,
                     interaction_type = interaction_type,
@@ -2183,6 +2571,34 @@ class Interaction(attrs_mod.AttributeHandler):
         )
 
 
+    def _pick_direction(self, effect, direction):
+        """
+        Selects the evidences of one direction with a certain effect, or
+        all evidences with the effect if *direction* is not a directed key.
+        """
+
+        picked = getattr(self, effect).get(direction)
+
+        return self._effect_evidences(effect) if picked is None else picked
+
+
+    # one value for the positive, negative and all signed evidences
+    @_rev_cached(size = 3)
+    def _effect_evidences(self, *effects):
+        """
+        The union of the evidences of all directions with any of the
+        *effects* (``'positive'`` or ``'negative'``), created only once
+        for each version of the evidences. The returned object must not
+        be modified.
+        """
+
+        return pypath_evidence.Evidences.merge_all(
+            evs
+            for effect in effects
+            for evs in getattr(self, effect).values()
+        )
+
+
     def get_entities(
             self,
             entity_type = None,
@@ -2500,7 +2916,7 @@ class Interaction(attrs_mod.AttributeHandler):
         """
 
         # evidence keys
-        for evs_key in ('undirected', this_direction):
+        for evs_key in (_UNDIRECTED, this_direction):
 
             # evidence dicts
             for this_effect in ('direction', 'positive', 'negative'):
@@ -2509,7 +2925,7 @@ class Interaction(attrs_mod.AttributeHandler):
                     # only undirected
                     (
                         direction == False and
-                        evs_key == 'undirected' and
+                        evs_key is _UNDIRECTED and
                         this_effect == 'direction'
                     ) or
                     # undirected
@@ -2521,7 +2937,7 @@ class Interaction(attrs_mod.AttributeHandler):
                     # directed
                     (
                         direction != False and
-                        evs_key != 'undirected' and
+                        evs_key is not _UNDIRECTED and
                         this_effect == 'direction' and
                         not effect and (
                             # any direction
@@ -2533,7 +2949,7 @@ class Interaction(attrs_mod.AttributeHandler):
                     # with effect
                     (
                         direction != False and
-                        evs_key != 'undirected' and
+                        evs_key is not _UNDIRECTED and
                         this_effect != 'direction' and (
                             # any effect
                             effect == True or
@@ -2833,30 +3249,6 @@ class Interaction(attrs_mod.AttributeHandler):
         )
 
 
-    @staticmethod
-    def _get(self, method, **kwargs):
-
-        via = kwargs['via'] if 'via' in kwargs else False
-
-        return getattr(
-            self.get_evidences(
-                **kwargs
-            ),
-            'get_%s' % method,
-        )(via = via)
-
-
-    @staticmethod
-    def _count(method):
-
-        @functools.wraps(method)
-        def count_method(*args, **kwargs):
-
-            return len(method(*args, **kwargs))
-
-        return count_method
-
-
     @staticmethod
     def _by(method, by = 'resources'):
 
@@ -2946,10 +3338,16 @@ class Interaction(attrs_mod.AttributeHandler):
 
         def _create_get_method(method):
 
-            @functools.wraps(method)
-            def _get_method(*args, **kwargs):
+            evidences_method = 'get_%s' % method
+
+            # positional arguments are accepted but ignored, only the
+            # criteria passed by keyword are used
+            def _get_method(self, *args, **kwargs):
 
-                return cls._get(self = args[0], method = method, **kwargs)
+                return getattr(
+                    self.get_evidences(**kwargs),
+                    evidences_method,
+                )(via = kwargs.get('via', False))
 
             return _get_method
 
@@ -2979,7 +3377,6 @@ class Interaction(attrs_mod.AttributeHandler):
 
             wrap_args = mode, direction, effect
 
-            @functools.wraps(wrap_args)
             def _degree_method(*args, **kwargs):
 
                 mode, direction, effect = wrap_args
@@ -2996,7 +3393,7 @@ class Interaction(attrs_mod.AttributeHandler):
             iteritems(cls._degree_directions)
         ):
 
-            if dir_label in {'undirected', 'non_directed'} and mode != 'ALL':
+            if dir_label in {_UNDIRECTED, 'non_directed'} and mode != 'ALL':
 
                 continue
 
@@ -3022,6 +3419,28 @@ class Interaction(attrs_mod.AttributeHandler):
     @classmethod
     def _generate_count_methods(cls):
 
+        def _create_count_method(method):
+
+            if method == 'references':
+
+                # counting directly on the evidences; not for the resources
+                # as those are deduplicated by equality in the get method
+                def _count_method(self, *args, **kwargs):
+
+                    return self.get_evidences(**kwargs).count_references(
+                        via = kwargs.get('via', False),
+                    )
+
+            else:
+
+                get_method = getattr(cls, 'get_%s' % method)
+
+                def _count_method(*args, **kwargs):
+
+                    return len(get_method(*args, **kwargs))
+
+            return _count_method
+
         for _get in cls._count_methods:
 
             _get_method = getattr(cls, 'get_%s' % _get)
@@ -3032,7 +3451,7 @@ class Interaction(attrs_mod.AttributeHandler):
 
             cls._add_method(
                 method_name = method_name,
-                method = cls._count(_get_method),
+                method = _create_count_method(_get),
                 signature = cls._get_method_signature,
                 doc = _get_method.__doc__,
             )
@@ -3176,7 +3595,7 @@ class Interaction(attrs_mod.AttributeHandler):
             for data_model in dmodels:
 
                 evs_undirected = self.get_evidences(
-                    direction = 'undirected',
+                    direction = _UNDIRECTED,
                     interaction_type = interaction_type,
                     data_model = data_model,
                 )
@@ -3271,7 +3690,7 @@ class Interaction(attrs_mod.AttributeHandler):
             'positive': self.positive[direction].asdict(),
             'negative': self.negative[direction].asdict(),
             'directed': self.unknown_effect[direction].asdict(),
-            'undirected': self.direction['undirected'].asdict(),
+            _UNDIRECTED: self.direction[_UNDIRECTED].asdict(),
         }
 
 
@@ -32,6 +32,7 @@ import itertools
 import functools
 import copy as copy_mod
 import pickle
+import hashlib
 import random
 import traceback
 from typing_extensions import Literal
@@ -3680,12 +3681,10 @@ class Network(session_mod.Logger):
     @classmethod
     def _generate_partners_methods(cls):
 
-        def _create_partners_method(method_args):
+        def _create_partners_method(method_args, count):
 
-            count = method_args.pop('count')
             method = 'count_partners' if count else 'partners'
 
-            @functools.wraps(method_args)
             def _partners_method(*args, **kwargs):
 
                 self = args[0]
@@ -3705,20 +3704,23 @@ class Network(session_mod.Logger):
             )
         ):
 
+            # the counting and the listing variants share the same
+            # arguments, and the methods never modify this dict
+            method_args = dict(
+                itertools.chain.from_iterable(
+                    iteritems(part) for part in arg_parts
+                )
+            )
+            _method_name = ''.join(name_parts)
+
             for count in (False, True):
 
-                method_args = dict(
-                    itertools.chain(
-                        *(iteritems(part) for part in arg_parts)
-                    )
-                )
-                method_name = ''.join(name_parts)
                 method_name = (
-                    'count_%s' % method_name if count else method_name
+                    'count_%s' % _method_name if count else _method_name
                 )
-                method_args['count'] = count
-                method = _create_partners_method(method_args)
+                method = _create_partners_method(method_args, count)
                 method.__name__ = method_name
+                method.__qualname__ = '%s.%s' % (cls.__name__, method_name)
 
                 setattr(
                     cls,
@@ -3851,7 +3853,55 @@ class Network(session_mod.Logger):
             return value
 
 
-        def find_all_paths_aux(start, end, path, maxlen = None):
+        def distances_to(end):
+            """
+            Shortest distances of the nodes to ``end``, up to ``maxlen``
+            steps, by walking the network backwards. If the interaction
+            criteria are different for the steps of the path, all
+            interactions are considered, hence the distances are never
+            overestimated.
+            """
+
+            if all(args == interaction_args[0] for args in interaction_args):
+
+                reverse_args = interaction_args[0].copy()
+                reverse_args['mode'] = (
+                    'IN'
+                        if reverse_args['mode'] == 'OUT' else
+                    'OUT'
+                        if reverse_args['mode'] == 'IN' else
+                    'ALL'
+                )
+
+            else:
+
+                reverse_args = {'mode': 'ALL'}
+
+            dist = {end: 0}
+            frontier = {end}
+
+            for d in range(1, maxlen + 1):
+
+                frontier = {
+                    partner
+                    for node in frontier
+                    for partner in self.partners(
+                        entity = node,
+                        **reverse_args
+                    )
+                    if partner not in dist
+                }
+
+                if not frontier:
+
+                    break
+
+                dist.update((node, d) for node in frontier)
+
+            return dist
+
+
+        def find_all_paths_aux(start, end, path, maxlen = None, dist = None):
 
             path = path + [start]
 
@@ -3888,11 +3938,21 @@ class Network(session_mod.Logger):
 
                 for node in next_steps:
 
+                    # no way to get to the end node from here within the
+                    # remaining steps
+                    if (
+                        dist is not None and
+                        dist.get(node, maxlen + 1) > maxlen - len(path)
+                    ):
+
+                        continue
+
                     paths.extend(
                         find_all_paths_aux(
                             node,
                             end,
-                            path, maxlen
+                            path, maxlen,
+                            dist = dist,
                         )
                     )
 
@@ -3921,6 +3981,15 @@ class Network(session_mod.Logger):
             for i in range(maxlen)
         )
 
+        # for specific end nodes we prune the search by the distances
+        # to the end nodes; with `maxlen` below 1 there are no steps and
+        # no paths to prune
+        dists = (
+            {e: distances_to(e) for e in end if e is not None}
+                if not loops and maxlen > 0 else
+            {}
+        )
+
         all_paths = []
 
         if not silent:
@@ -3935,7 +4004,15 @@ class Network(session_mod.Logger):
                 if not silent:
                     prg.step()
 
-                all_paths.extend(find_all_paths_aux(s, e, [], maxlen))
+                dist = dists.get(e)
+
+                if dist is not None and s not in dist:
+
+                    continue
+
+                all_paths.extend(
+                    find_all_paths_aux(s, e, [], maxlen, dist = dist)
+                )
 
         if not silent:
             prg.terminate()
@@ -3963,7 +4040,11 @@ class Network(session_mod.Logger):
                 :py:class:`pypath.interaction.Interaction`.
         """
 
-        result = set() if not by else collections.defaultdict(set)
+        result = set()
+        # by group we only collect the sets here and union them in one
+        # go at the end, instead of updating the group sets for each
+        # interaction
+        buckets = collections.defaultdict(list)
 
         method = self._get_by_method_name(what, by)
 
@@ -3981,17 +4062,24 @@ class Network(session_mod.Logger):
 
                     for grp, val in iteritems(ia_attrs):
 
-                        result[grp].update(val)
+                        buckets[grp].append(val)
 
                 else:
 
                     result.update(ia_attrs)
 
+        if by:
+
+            result = {
+                grp: set().union(*values)
+                for grp, values in iteritems(buckets)
+            }
+
         if by and add_total:
 
             result['total'] = set.union(*result.values())
 
-        return dict(result) if by else result
+        return result
 
 
     @classmethod
@@ -3999,7 +4087,6 @@ class Network(session_mod.Logger):
 
         def _create_collect_method(what):
 
-            @functools.wraps(what)
             def _collect_method(self, **kwargs):
 
                 kwargs['what'] = what
@@ -4025,6 +4112,7 @@ class Network(session_mod.Logger):
 
             method = _create_collect_method(_get)
             method_name = 'collect_%s' % _get
+            method.__qualname__ = '%s.%s' % (cls.__name__, method_name)
             doc = (
                 'Builds a comprehensive collection of `%s` entities '
                 'across the network, counts unique and shared objects '
@@ -4044,7 +4132,66 @@ class Network(session_mod.Logger):
             )
 
 
-    def update_summaries(self, collect_args = None):
+    def _summaries_cache_path(self, collect_args = None):
+        """
+        Path to the cache file of the summaries for the current state of
+        the network. The file name is derived from the resources and
+        references of all evidences in each direction and sign of all
+        interactions, hence any change in the network results a different
+        file name.
+        """
+
+        state = hashlib.md5(
+            repr(sorted(iteritems(collect_args or {}))).encode('utf-8')
+        )
+
+        for ia in sorted(self, key = lambda ia: ia.key):
+
+            state.update(repr(ia.key).encode('utf-8'))
+
+            for evs in (
+                ia.evidences,
+                ia.direction[ia.a_b],
+                ia.direction[ia.b_a],
+                ia.direction['undirected'],
+                ia.positive[ia.a_b],
+                ia.positive[ia.b_a],
+                ia.negative[ia.a_b],
+                ia.negative[ia.b_a],
+            ):
+
+                state.update(
+                    repr(
+                        sorted(
+                            (repr(ev.key), sorted(ev.pubmeds))
+                            for ev in evs
+                        )
+                    ).encode('utf-8')
+                )
+
+        return os.path.join(
+            self.cache_dir,
+            'network_summaries_%s.pickle' % state.hexdigest(),
+        )
+
+
+    def update_summaries(self, collect_args = None, cache = None):
+        """
+        Compiles the summary records of the network by resource, data model
+        and interaction type and stores them in the ``summaries`` attribute.
+
+        Args
+            collect_args:
+                Passed to the ``collect_*`` methods.
+            cache:
+                Load the summaries from the cache if it has been built
+                before for the exact same network, and save them to the
+                cache otherwise. By default the ``network_summaries_cache``
+                setting is used, which is ``False`` unless set otherwise.
+                Finding the cache file requires processing all evidences
+                in the network, and a new file is created for each state
+                of the network.
+        """
 
 
         def get_labels(lab, key, segments):
@@ -4064,24 +4211,34 @@ class Network(session_mod.Logger):
             )
 
 
-        def add_resource_segments(rec, res, key, lab, segments, coll):
+        def segment_values(collection, segment_keys):
+            """
+            Counts and percentages for each segment, in the same order as
+            the labels from ``get_labels``: the count and the percentage
+            of each segment follow each other.
+            """
 
-            get = coll[key].__getattribute__
+            get = collection.__getattribute__
 
-            values = tuple(itertools.chain(*zip(*(
-                (
-                    get('%s_collection' % n_pct).get(res, 0),
-                    get('%s_shared_within_data_model' % n_pct).get(res, 0),
-                    get('%s_unique_within_data_model' % n_pct).get(res, 0),
-                    get(
-                        '%s_shared_within_interaction_type' % n_pct
-                    ).get(res, 0),
-                    get(
-                        '%s_unique_within_interaction_type' % n_pct
-                    ).get(res, 0),
-                )
+            return tuple(
+                get('%s_%s' % (n_pct, attr)).get(seg_key, 0)
+                for attr, seg_key in segment_keys
                 for n_pct in ('n', 'pct')
-            ))))
+            )
+
+
+        def add_resource_segments(rec, res, key, lab, segments, coll):
+
+            values = segment_values(
+                coll[key],
+                (
+                    ('collection', res),
+                    ('shared_within_data_model', res),
+                    ('unique_within_data_model', res),
+                    ('shared_within_interaction_type', res),
+                    ('unique_within_interaction_type', res),
+                ),
+            )
 
             labels = get_labels(lab, key, segments)
 
@@ -4095,22 +4252,16 @@ class Network(session_mod.Logger):
             it_dm_key = (itype, dmodel)
             total_key = it_dm_key + ('Total',)
 
-            get = coll[key].__getattribute__
-
-            values = tuple(itertools.chain(*zip(*(
+            values = segment_values(
+                coll[key],
                 (
-                    get('%s_by_data_model' % n_pct).get(it_dm_key, 0),
-                    get(
-                        '%s_shared_within_data_model' % n_pct
-                    ).get(total_key, 0),
-                    get(
-                        '%s_unique_within_data_model' % n_pct
-                    ).get(total_key, 0),
-                    get('%s_shared_by_data_model' % n_pct).get(it_dm_key, 0),
-                    get('%s_unique_by_data_model' % n_pct).get(it_dm_key, 0),
-                )
-                for n_pct in ('n', 'pct')
-            ))))
+                    ('by_data_model', it_dm_key),
+                    ('shared_within_data_model', total_key),
+                    ('unique_within_data_model', total_key),
+                    ('shared_by_data_model', it_dm_key),
+                    ('unique_by_data_model', it_dm_key),
+                ),
+            )
 
             labels = get_labels(lab, key, segments)
 
@@ -4121,23 +4272,18 @@ class Network(session_mod.Logger):
 
         def add_itype_segments(rec, itype, key, lab, segments, coll):
 
-            get = coll[key].__getattribute__
             total_key = (itype, 'all', 'Total')
 
-            values = tuple(itertools.chain(*zip(*(
+            values = segment_values(
+                coll[key],
                 (
-                    get('%s_by_interaction_type' % n_pct).get(itype, 0),
-                    get(
-                        '%s_shared_within_interaction_type' % n_pct
-                    ).get(total_key, 0),
-                    get(
-                        '%s_unique_within_interaction_type' % n_pct
-                    ).get(total_key, 0),
-                    get('%s_shared_by_data_model' % n_pct).get(total_key, 0),
-                    get('%s_unique_by_data_model' % n_pct).get(total_key, 0),
-                )
-                for n_pct in ('n', 'pct')
-            ))))
+                    ('by_interaction_type', itype),
+                    ('shared_within_interaction_type', total_key),
+                    ('unique_within_interaction_type', total_key),
+                    ('shared_by_data_model', total_key),
+                    ('unique_by_data_model', total_key),
+                ),
+            )
 
             labels = get_labels(lab, key, segments)
 
@@ -4148,6 +4294,22 @@ class Network(session_mod.Logger):
 
         collect_args = collect_args or {'via': False}
 
+        cache = settings.get('network_summaries_cache', override = cache)
+
+        if cache:
+
+            cache_path = self._summaries_cache_path(collect_args)
+
+            if os.path.exists(cache_path):
+
+                self._log('Loading summaries from `%s`.' % cache_path)
+
+                with open(cache_path, 'rb') as fp:
+
+                    self.summaries = pickle.load(fp)
+
+                return
+
 
         required = collections.OrderedDict(
             entities = 'Entities',
@@ -4246,6 +4408,14 @@ class Network(session_mod.Logger):
             for rec in self.summaries
         ]
 
+        if cache:
+
+            with open(cache_path, 'wb') as fp:
+
+                pickle.dump(self.summaries, fp)
+
+            self._log('Summaries saved to `%s`.' % cache_path)
+
         self._log('Finished updating summaries.')
 
 
@@ -4357,7 +4527,6 @@ class Network(session_mod.Logger):
 
             wrap_args = (what, by)
 
-            @functools.wraps(wrap_args)
             def _get_by_method(*args, **kwargs):
 
                 what, by = wrap_args
@@ -4374,11 +4543,14 @@ class Network(session_mod.Logger):
         for _get, _by in cls._iter_get_by_methods():
 
             method_name = cls._get_by_method_name(_get, _by)
+            method = _create_get_method(what = _get, by = _by)
+            method.__name__ = method_name
+            method.__qualname__ = '%s.%s' % (cls.__name__, method_name)
 
             setattr(
                 cls,
                 method_name,
-                _create_get_method(what = _get, by = _by),
+                method,
             )
 
 
@@ -4389,18 +4561,22 @@ class Network(session_mod.Logger):
 
             method_name = cls._get_by_method_name(what, by)
 
-            @functools.wraps(method_name)
-            def _count_method(*args, **kwargs):
+            # without `by` the collection is always a set, otherwise
+            # always a dict of sets, hence we decide here once which
+            # counting function to use
+            if by is None:
 
-                self = args[0]
+                def _count_method(*args, **kwargs):
 
-                collection = getattr(self, method_name)(**kwargs)
+                    return len(getattr(args[0], method_name)(**kwargs))
 
-                return (
-                    len(collection)
-                        if isinstance(collection, set) else
-                    common.dict_counts(collection)
-                )
+            else:
+
+                def _count_method(*args, **kwargs):
+
+                    return common.dict_counts(
+                        getattr(args[0], method_name)(**kwargs)
+                    )
 
             return _count_method
 
@@ -4413,10 +4589,14 @@ class Network(session_mod.Logger):
                 )
             )
 
+            method = _create_count_method(what = _get, by = _by)
+            method.__name__ = method_name
+            method.__qualname__ = '%s.%s' % (cls.__name__, method_name)
+
             setattr(
                 cls,
                 method_name,
-                _create_count_method(what = _get, by = _by)
+                method,
             )
 
 
@@ -0,0 +1,169 @@
+import pypath.core.evidence as evidence
+import pypath.internals.resource as resource
+
+
+def _resource(name, interaction_type = 'post_translational', via = None):
+
+    return resource.NetworkResource(
+        name = name,
+        interaction_type = interaction_type,
+        data_model = 'activity_flow',
+        via = via,
+    )
+
+
+def _evidence(name, references = (), **kwargs):
+
+    return evidence.Evidence(
+        resource = _resource(name, **kwargs),
+        references = list(references),
+    )
+
+
+def test_iadd_evidence():
+
+    evs = evidence.Evidences()
+    evs += _evidence('SIGNOR', references = ['1'])
+
+    assert evs.get_resource_names() == {'SIGNOR'}
+
+    evs += _evidence('SPIKE')
+    evs += _evidence('SIGNOR', references = ['2'])
+
+    assert evs.get_resource_names() == {'SIGNOR', 'SPIKE'}
+    assert len(evs) == 2
+    assert {
+        ref.pmid
+        for ref in evs.evidences[_resource('SIGNOR').key].references
+    } == {'1', '2'}
+
+
+def test_match_any():
+
+    evs = [
+        _evidence('SIGNOR'),
+        _evidence('SPIKE', via = 'X'),
+        _evidence('TF', interaction_type = 'transcriptional'),
+    ]
+    queries = [
+        (None, {}),
+        ([_resource('SIGNOR'), _resource('TF')], {}),
+        ([_resource('Lit')], {}),
+        ([{'SPIKE'}, {'Lit'}], {'via': None}),
+        ([{'SPIKE'}], {}),
+        (None, {'interaction_type': 'transcriptional'}),
+        ([{'TF', 'SIGNOR'}], {'interaction_type': 'post_translational'}),
+    ]
+
+    for ev in evs:
+
+        for resources, kwargs in queries:
+
+            expected = any(
+                ev.match(resource = res, **kwargs)
+                for res in resources or (None,)
+            )
+
+            assert ev.match_any(resources, **kwargs) == expected
+
+
+def test_merge_all():
+
+    collections = [
+        evidence.Evidences([
+            _evidence('SIGNOR', references = ['1']),
+            _evidence('SPIKE', references = ['2']),
+        ]),
+        evidence.Evidences([
+            _evidence('SIGNOR', references = ['3']),
+            _evidence('TF', interaction_type = 'transcriptional'),
+        ]),
+        evidence.Evidences(),
+        evidence.Evidences([
+            _evidence('SIGNOR', references = ['1', '4']),
+            _evidence('SPIKE', via = 'X'),
+        ]),
+    ]
+
+    signor = _resource('SIGNOR').key
+    signor_refs = set(collections[0].evidences[signor].references)
+    expected = evidence.Evidences()
+
+    for evs in collections:
+
+        expected += evs
+
+    merged = evidence.Evidences.merge_all(collections)
+
+    assert set(merged.evidences) == set(expected.evidences)
+
+    for key, ev in merged.evidences.items():
+
+        assert ev.references == expected.evidences[key].references
+
+    assert not evidence.Evidences.merge_all([])
+    # the merged collections are not modified
+    assert collections[0].evidences[signor].references == signor_refs
+
+
+def _positive_negative():
+
+    positive = evidence.Evidences([
+        _evidence('SIGNOR', references = ['1', '2']),
+        _evidence('SPIKE', references = ['2'], via = 'X'),
+        _evidence('TF', references = ['3'], interaction_type = 'transcriptional'),
+        _evidence('Lit'),
+    ])
+    negative = evidence.Evidences([
+        _evidence('SIGNOR', references = ['4']),
+        _evidence('SPIKE', references = ['5', '6']),
+    ])
+
+    return positive, negative
+
+
+def test_count_pos_neg():
+
+    positive, negative = _positive_negative()
+
+    for by in ('resources', 'references', 'curation_effort'):
+
+        for interaction_type in (None, 'post_translational', 'transcriptional'):
+
+            for via in (None, False, True):
+
+                kwargs = {'interaction_type': interaction_type, 'via': via}
+                method = 'count_%s' % by
+
+                assert evidence.Evidences.count_pos_neg(
+                    positive,
+                    negative,
+                    by = by,
+                    **kwargs
+                ) == (
+                    getattr(positive, method)(**kwargs),
+                    getattr(negative, method)(**kwargs),
+                )
+
+
+def test_intersects():
+
+    positive, negative = _positive_negative()
+    queries = [
+        set(),
+        {'SIGNOR'},
+        {'Lit', 'TF'},
+        {'NotThere'},
+        [_resource('SIGNOR')],
+        [_resource('SPIKE')],
+        [_resource('SPIKE', via = 'X')],
+        [_resource('NotThere')],
+        negative,
+        evidence.Evidences([_evidence('NotThere')]),
+    ]
+
+    for evs in (positive, negative, evidence.Evidences()):
+
+        for other in queries:
+
+            assert evs.intersects(other) == bool(evs & other)
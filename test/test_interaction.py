@@ -0,0 +1,374 @@
+import copy
+import pickle
+
+import pytest
+
+import pypath.share.common as common
+import pypath.core.interaction as interaction
+import pypath.internals.resource as resource
+
+
+def _interaction():
+
+    return interaction.Interaction('P00533', 'P01133')
+
+
+def test_add_sign():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+
+    assert ia.get_sign(ia.a_b, 'positive', resource_names = True) == {'X'}
+    assert ia.get_sign(ia.a_b, 'negative', resource_names = True) == set()
+    assert ia.get_direction(ia.a_b, resource_names = True) == {'X'}
+    assert not ia.get_sign(ia.b_a, 'positive')
+
+
+def test_pickle():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'negative', resource = 'X', references = {'1'})
+
+    new = pickle.loads(pickle.dumps(ia))
+
+    assert new == ia
+    assert hash(new) == hash(ia)
+    assert new.direction_key(('P00533', 'P01133')) == ia.a_b
+    assert new.get_sign(ia.a_b, 'negative', resource_names = True) == {'X'}
+    assert copy.copy(new).get_direction(ia.a_b, resource_names = True) == {'X'}
+
+
+def test_setstate_earlier_version():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X')
+
+    # instances pickled before these attributes were introduced
+    _, state = ia.__reduce_ex__(2)[2]
+    state = dict(state)
+    del state['_entity_map']
+    del state['_directed_keys']
+
+    new = interaction.Interaction.__new__(interaction.Interaction)
+    new.__setstate__((None, state))
+
+    assert new.direction_key(('P00533', 'P01133')) == ia.a_b
+    assert new.get_direction(ia.a_b, resource_names = True) == {'X'}
+    assert new.get_sign(ia.a_b, 'positive', resource_names = True) == {'X'}
+    assert copy.copy(new) == ia
+
+
+def test_rev_cache_bounded():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+
+    for by_references in (False, True):
+
+        for only_primary in (False, True):
+
+            ia.consensus(
+                by_references = by_references,
+                only_primary = only_primary,
+            )
+            ia.majority_dir(
+                by_references = by_references,
+                only_primary = only_primary,
+            )
+
+    assert all(
+        len(results) <= interaction._REV_CACHE_SIZE
+        for results in ia._cache[1].values()
+    )
+    assert ia.majority_dir() == ia.a_b
+
+    ia.add_sign(ia.b_a, 'positive', resource = 'Y', references = {'2'})
+    ia.add_sign(ia.b_a, 'positive', resource = 'Z', references = {'3'})
+
+    assert ia.majority_dir() == ia.b_a
+
+
+def test_rev_cache_per_method():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+
+    ia.consensus()
+    cached = {
+        name: dict(results)
+        for name, results in ia._cache[1].items()
+    }
+
+    assert {'_consensus', '_majority_sign', 'majority_dir'} <= set(cached)
+
+    # the values used by one call do not evict each other
+    ia.consensus()
+
+    assert all(
+        ia._cache[1][name][key] is value
+        for name, results in cached.items()
+        for key, value in results.items()
+    )
+
+
+def test_get_evidences_cached():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+    ia.add_sign(ia.b_a, 'negative', resource = 'Y', references = {'2'})
+
+    evs = ia.get_evidences(effect = 'positive')
+
+    assert evs.get_resource_names() == {'X'}
+
+    # the result is a copy, the cached evidences are not modified
+    evs += ia.get_evidences(effect = 'negative')
+
+    assert ia.get_evidences(effect = 'positive').get_resource_names() == {'X'}
+    assert ia.get_evidences(
+        effect = True,
+        interaction_type = 'PPI',
+    ).get_resource_names() == {'X', 'Y'}
+
+    ia.add_sign(ia.a_b, 'positive', resource = 'Z', references = {'3'})
+
+    assert ia.get_evidences(
+        effect = 'positive',
+    ).get_resource_names() == {'X', 'Z'}
+    assert ia.get_evidences(
+        effect = True,
+        interaction_type = 'PPI',
+    ).get_resource_names() == {'X', 'Y', 'Z'}
+
+
+def test_consensus_not_shared():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+
+    expected = [[ia.a, ia.b, 'directed', 'positive']]
+    result = ia.consensus()
+
+    assert result == expected
+
+    result.append(['spam'])
+    result[0][3] = 'negative'
+
+    assert ia.consensus() == expected
+
+
+def test_majority_sign_not_shared():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'negative', resource = 'X', references = {'1'})
+
+    expected = {ia.a_b: [False, True], ia.b_a: [False, False]}
+    result = ia.majority_sign()
+
+    assert result == expected
+
+    result[ia.a_b][0] = True
+    del result[ia.b_a]
+
+    assert ia.majority_sign() == expected
+
+
+def test_rev_cache_invalidated():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+
+    assert ia.which_dirs() == (ia.a_b,)
+    assert ia.majority_dir() == ia.a_b
+    assert ia.majority_sign()[ia.a_b] == [True, False]
+
+    ia.add_sign(ia.b_a, 'negative', resource = 'Y', references = {'2'})
+    ia.add_sign(ia.b_a, 'negative', resource = 'Z', references = {'3'})
+
+    assert set(ia.which_dirs()) == {ia.a_b, ia.b_a}
+    assert ia.majority_dir() == ia.b_a
+    assert ia.majority_sign()[ia.b_a] == [False, True]
+    assert ia.consensus() == [[ia.b, ia.a, 'directed', 'negative']]
+
+
+def test_data_models():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', data_model = 'activity_flow')
+
+    assert ia.data_models == {'activity_flow'}
+    assert isinstance(ia.data_models, set)
+
+    # the result is a copy, the cached value is not modified
+    ia.data_models.add('ppi')
+
+    assert ia.data_models == {'activity_flow'}
+
+    ia.add_sign(ia.b_a, 'positive', resource = 'Y', data_model = 'ppi')
+
+    assert ia.data_models == {'activity_flow', 'ppi'}
+
+
+def test_consensus_records():
+
+    ia0 = _interaction()
+    ia0.add_sign(ia0.a_b, 'positive', resource = 'X', references = {'1'})
+    ia0.add_sign(ia0.a_b, 'negative', resource = 'Y', references = {'2'})
+    ia1 = interaction.Interaction('P04637', 'Q00987')
+    ia1.add_evidence(
+        resource.NetworkResource('Z', interaction_type = 'PPI'),
+        direction = 'undirected',
+    )
+
+    rec = interaction.Interaction.consensus_records([ia0, ia1])
+
+    assert rec.dtype.names == ('source', 'target', 'directed', 'sign')
+    assert all(rec.dtype[name].kind == 'U' for name in rec.dtype.names)
+    assert [tuple(r) for r in rec.tolist()] == [
+        (ia0.a.identifier, ia0.b.identifier, 'directed', 'positive'),
+        (ia0.a.identifier, ia0.b.identifier, 'directed', 'negative'),
+        (ia1.a.identifier, ia1.b.identifier, 'undirected', 'unknown'),
+    ]
+    assert [
+        list(edge)
+        for ia in (ia0, ia1)
+        for edge in ia.consensus()
+    ] == [
+        [ia0.a, ia0.b, 'directed', 'positive'],
+        [ia0.a, ia0.b, 'directed', 'negative'],
+        [ia1.a, ia1.b, 'undirected', 'unknown'],
+    ]
+
+    empty = interaction.Interaction.consensus_records([])
+
+    assert len(empty) == 0
+    assert empty.dtype.names == ('source', 'target', 'directed', 'sign')
+
+
+def _unknown_effect_interaction():
+
+    ia = _interaction()
+    ia.add_evidence(
+        resource.NetworkResource('X', interaction_type = 'PPI'),
+        direction = ia.a_b,
+        effect = 0,
+    )
+
+    return ia
+
+
+def test_translate_unknown_effect():
+
+    ia = _unknown_effect_interaction()
+
+    new = ia.translate({ia.a: 'Q1', ia.b: 'Q2'}, new_attrs = {})
+
+    assert new.unknown_effect[new.a_b].get_resource_names() == {'X'}
+    assert not new.unknown_effect[new.b_a]
+
+    # the order of the nodes is reversed by the translation
+    new = ia.translate({ia.a: 'Q2', ia.b: 'Q1'}, new_attrs = {})
+
+    assert new.unknown_effect[new.b_a].get_resource_names() == {'X'}
+    assert not new.unknown_effect[new.a_b]
+
+
+def test_merge_unknown_effect():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'Y')
+    other = _unknown_effect_interaction()
+
+    ia.merge(other)
+
+    assert ia.unknown_effect[ia.a_b].get_resource_names() == {'X'}
+    assert ia.positive[ia.a_b].get_resource_names() == {'Y'}
+    assert ia.get_direction(ia.a_b, resource_names = True) == {'X', 'Y'}
+
+    ia = _interaction()
+    ia += _unknown_effect_interaction()
+
+    assert ia.unknown_effect[ia.a_b].get_resource_names() == {'X'}
+
+
+def test_effect_evidences_cached():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+    ia.add_sign(ia.b_a, 'positive', resource = 'Y', references = {'2'})
+    ia.add_sign(ia.b_a, 'negative', resource = 'Z', references = {'3'})
+
+    union = ia._effect_evidences('positive')
+
+    assert union.get_resource_names() == {'X', 'Y'}
+    assert ia._effect_evidences('positive') is union
+    assert ia._effect_evidences(
+        'positive',
+        'negative',
+    ).get_resource_names() == {'X', 'Y', 'Z'}
+
+    evs = ia.get_evidences(effect = 'positive')
+    evs += ia.get_evidences(effect = 'negative')
+
+    assert union.get_resource_names() == {'X', 'Y'}
+
+    ia.add_sign(ia.a_b, 'positive', resource = 'W', references = {'4'})
+
+    assert ia._effect_evidences('positive') is not union
+    assert ia.get_evidences(
+        effect = 'positive',
+    ).get_resource_names() == {'W', 'X', 'Y'}
+
+
+def test_has_sign():
+
+    ia = _interaction()
+    ia.add_sign(ia.a_b, 'positive', resource = 'X', references = {'1'})
+    ia.add_sign(ia.b_a, 'negative', resource = 'Y', references = {'2'})
+    other = _unknown_effect_interaction()
+
+    for _ia in (ia, other, _interaction()):
+
+        for direction in (None, _ia.a_b, _ia.b_a):
+
+            for resources in (None, 'X', {'Y'}, {'X', 'Y'}, 'Z'):
+
+                kwargs = {'direction': direction, 'resources': resources}
+
+                assert _ia.has_sign(**kwargs) == (
+                    _ia.is_stimulation(**kwargs) or
+                    _ia.is_inhibition(**kwargs)
+                )
+
+    assert ia.has_sign(ia.a_b, resources = 'X')
+    assert not ia.has_sign(ia.a_b, resources = 'Y')
+    assert not other.has_sign()
+
+
+def test_resources_set():
+
+    ia = _interaction()
+
+    for resources in (None, 'X', ('X', 'Y'), frozenset(('X',)), {'X'}, ['X']):
+
+        assert ia._resources_set(resources) == common.to_set(resources)
+
+    assert ia._resources_set(('X', 'Y')) is ia._resources_set(('X', 'Y'))
+
+    class UnhashableTuple(tuple):
+
+        __hash__ = None
+
+    # unhashable arguments are converted without the cache
+    assert ia._resources_set(UnhashableTuple(('X', 'Y'))) == {'X', 'Y'}
+
+    # unhashable elements: the same as without the cache
+    for resources in ((['X'],), ({'X': 1},)):
+
+        with pytest.raises(TypeError):
+
+            common.to_set(resources)
+
+        with pytest.raises(TypeError):
+
+            ia._resources_set(resources)
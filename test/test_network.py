@@ -0,0 +1,198 @@
+import os
+import glob
+import pickle
+
+import pypath.share.settings as settings
+import pypath.core.network as network
+import pypath.core.interaction as interaction
+import pypath.internals.resource as resource
+
+
+def _network(cache_dir):
+
+    net = network.Network()
+    net.cache_dir = str(cache_dir)
+    _add_interaction(net, 'P00533', 'P01133', 'X')
+
+    return net
+
+
+def _add_interaction(net, a, b, name):
+
+    ia = interaction.Interaction(a, b)
+    ia.add_evidence(
+        resource.NetworkResource(
+            name,
+            interaction_type = 'PPI',
+            data_model = 'interaction',
+        ),
+        direction = ia.a_b,
+        effect = 1,
+    )
+    net.add_interaction(ia)
+
+
+def _cache_files(cache_dir):
+
+    return glob.glob(os.path.join(str(cache_dir), 'network_summaries_*'))
+
+
+def test_summaries_cache_off_by_default(tmp_path):
+
+    net = _network(tmp_path)
+
+    assert not settings.get('network_summaries_cache')
+
+    net.update_summaries()
+
+    assert net.summaries
+    assert not _cache_files(tmp_path)
+
+
+def test_summaries_cache_miss_and_hit(tmp_path):
+
+    net = _network(tmp_path)
+    net.update_summaries(cache = False)
+    expected = net.summaries
+
+    # miss: the summaries are built and saved
+    net.update_summaries(cache = True)
+    path = net._summaries_cache_path({'via': False})
+
+    assert net.summaries == expected
+    assert _cache_files(tmp_path) == [path]
+
+    # hit: the summaries are loaded from the file
+    with open(path, 'wb') as fp:
+
+        pickle.dump(['cached'], fp)
+
+    net.update_summaries(cache = True)
+
+    assert net.summaries == ['cached']
+
+    # any change in the network results a miss
+    _add_interaction(net, 'P04637', 'Q00987', 'Y')
+    net.update_summaries(cache = True)
+
+    assert net.summaries != ['cached']
+    assert len(_cache_files(tmp_path)) == 2
+
+
+_PATHS_NODES = ('P00533', 'P01133', 'P04637', 'Q00987', 'P31749', 'P42345')
+
+
+def _paths_network():
+
+    net = network.Network()
+    a, b, c, d, e, f = _PATHS_NODES
+
+    for source, target, direction in (
+        (a, b, True),
+        (b, c, True),
+        (c, d, True),
+        (a, c, True),
+        (d, a, True),
+        (b, e, False),
+        (e, d, True),
+        (f, a, True),
+    ):
+
+        ia = interaction.Interaction(source, target)
+        ia.add_evidence(
+            resource.NetworkResource(
+                'X',
+                interaction_type = 'post_translational',
+                data_model = 'activity_flow',
+            ),
+            direction = (
+                ia.direction_key((source, target))
+                    if direction else
+                'undirected'
+            ),
+        )
+        net.add_interaction(ia)
+
+    return net
+
+
+def _unpruned_paths(net, start, end, minlen = 1, maxlen = 2, **kwargs):
+    """
+    Paths ending in any of ``end``, collected from the searches without
+    end nodes, which are not pruned.
+    """
+
+    end = {net.entity(e) for e in end}
+
+    return [
+        path
+        for length in range(max(1, minlen), maxlen + 1)
+        for path in net.find_paths(
+            start,
+            maxlen = length,
+            minlen = length,
+            silent = True,
+            **kwargs
+        )
+        if path[-1] in end
+    ]
+
+
+def test_find_paths_pruned():
+
+    net = _paths_network()
+    a, b, c, d, e, f = _PATHS_NODES
+    queries = [
+        ((a,), (d,), {}),
+        ((a, f), (d, e), {'maxlen': 3}),
+        ((f,), (d,), {'maxlen': 3}),
+        ((f,), (d,), {'maxlen': 4, 'minlen': 3}),
+        ((a,), (b,), {'maxlen': 1}),
+        ((d,), (f,), {'maxlen': 4}),
+        ((c,), (c,), {'maxlen': 3}),
+        ((d,), (f, b), {'maxlen': 3, 'mode': 'IN'}),
+        ((a,), (e,), {'maxlen': 3, 'mode': 'ALL'}),
+        ((f, e), (c, d), {'maxlen': 4, 'mode': 'ALL'}),
+        ((a,), (d,), {'maxlen': 3, 'direction': True}),
+        ((a,), (e,), {'maxlen': 3, 'mode': ('OUT', 'ALL')}),
+        ((d,), (b,), {'maxlen': 3, 'mode': ('IN', 'OUT', 'ALL')}),
+    ]
+
+    for start, end, kwargs in queries:
+
+        paths = net.find_paths(start, end, silent = True, **kwargs)
+        expected = _unpruned_paths(net, start, end, **kwargs)
+
+        assert sorted(map(tuple, paths)) == sorted(map(tuple, expected))
+
+    # no steps, no paths
+    for kwargs in ({'maxlen': 0}, {'maxlen': 0, 'mode': 'ALL'}, {'maxlen': -1}):
+
+        assert net.find_paths(a, d, silent = True, **kwargs) == []
+        assert _unpruned_paths(net, (a,), (d,), **kwargs) == []
+
+    # the shortest path is exactly `maxlen` long
+    assert [
+        [n.identifier for n in path]
+        for path in net.find_paths(f, d, maxlen = 3, silent = True)
+    ] == [[f, a, c, d]]
+    assert not net.find_paths(f, d, maxlen = 2, silent = True)
+
+
+def test_generated_method_names():
+
+    prefixes = ('partners', 'get_', 'count_', 'collect_')
+    names = [
+        name
+        for name, attr in vars(network.Network).items()
+        if callable(attr) and name.startswith(prefixes)
+    ]
+
+    assert any(name.startswith('collect_') for name in names)
+
+    for name in names:
+
+        method = getattr(network.Network, name)
+
+        assert method.__name__ == name
+        assert method.__qualname__ == 'Network.%s' % name